@@ -1,10 +1,34 @@
 import base64
+import functools
 import json
+import os
 import time
 
+import urllib3
 import yaml
 from kubernetes import client, config
 
+# HTTP status codes of API errors that are worth retrying.
+RETRIABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_custom_api(kubeconfig_path, mtime_ns):
+    """
+    Return the CustomObjectsApi for the given kubeconfig, creating it on first use.
+
+    Helpers for the same kubeconfig share one API client, so the kubeconfig is
+    loaded once and its connection pool is reused across helpers. The client is
+    keyed by the file's modification time as well, so a rewritten kubeconfig is
+    loaded again.
+
+    :param kubeconfig_path: Path to the kubeconfig file.
+    :param mtime_ns: Modification time of the file, used as cache key.
+    :return: A tuple (custom_api, api_client).
+    """
+    api_client = config.new_client_from_config(config_file=kubeconfig_path)
+    return client.CustomObjectsApi(api_client), api_client
+
 
 class GardenerHelper:
     def __init__(self, kubeconfig_path, namespace, shoot_name):
@@ -19,13 +43,18 @@ class GardenerHelper:
         self.namespace = namespace
         self.shoot_name = shoot_name
 
-        # Load the kubeconfig and create the CustomObjectsApi instance.
-        config.load_kube_config(config_file=self.kubeconfig_path)
-        self.custom_api = client.CustomObjectsApi()
+        # Reuse the CustomObjectsApi instance shared by all helpers for the kubeconfig.
+        self.custom_api, self.api_client = _get_custom_api(
+            self.kubeconfig_path, os.stat(self.kubeconfig_path).st_mtime_ns
+        )
 
     def safe_call_with_retries(self, func, max_retries=3, interval=10):
         """
         Safely call a function with retries.
+
+        Only connection errors and API errors with a status in RETRIABLE_STATUS_CODES
+        are retried; any other error is raised immediately.
+
         :param func: The function to call.
         :param max_retries: The maximum number of retries.
         :param interval: Time (in seconds) between each retry.
@@ -34,11 +63,16 @@ class GardenerHelper:
         retries = 0
         while retries < max_retries:
             try:
-            return func()
-            except Exception as e:
-            print(f"Error occurred: {e}")
-            retries += 1
-            time.sleep(interval)
+                return func()
+            except (client.exceptions.ApiException, urllib3.exceptions.HTTPError) as e:
+                if (
+                    isinstance(e, client.exceptions.ApiException)
+                    and e.status not in RETRIABLE_STATUS_CODES
+                ):
+                    raise
+                print(f"Error occurred: {e}")
+                retries += 1
+                time.sleep(interval)
         raise Exception("Max retries exceeded. Aborting operation.")
 
     def create_shoot(self, template_file_path=None, template_string=None):
@@ -120,8 +154,8 @@ class GardenerHelper:
         :param interval: Time (in seconds) between each poll.
         :return: True, False, or "in-progress"
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             shoot = self.get_shoot()
             if shoot and "status" in shoot and "lastOperation" in shoot["status"]:
                 state = shoot["status"]["lastOperation"].get("state", "Progressing")
@@ -147,8 +181,8 @@ class GardenerHelper:
         :param interval: Time (in seconds) between each poll.
         :return: True or "in-progress"
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
                 # Try to retrieve the shoot; if it exists, deletion is not complete.
                 self.custom_api.get_namespaced_custom_object(
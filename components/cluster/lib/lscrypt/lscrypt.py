@@ -1,37 +1,65 @@
 #!/usr/bin/env python3
 
+import subprocess
 import yaml
 import common
 from landscape_tools import subprocess_helper
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+
+class _SortedDumper(SafeDumper):
+    """
+    Dumper producing the same layout as `bosh int`, which the stored files were
+    formatted with: multi-line strings as literal blocks, and strings that would
+    read as another type (e.g. "80" or "true") in double quotes.
+    """
+
+
+def _represent_str(dumper, value):
+    if "\n" in value:
+        style = "|"
+    elif dumper.resolve(yaml.ScalarNode, value, (True, False)) != "tag:yaml.org,2002:str":
+        style = '"'
+    else:
+        style = None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_SortedDumper.add_representer(str, _represent_str)
+
 def read_yaml_file(component_name, filename):
-    return yaml.safe_load(subprocess_helper.exec_subprocess(
-        command=["lscrypt", "read", "-d", component_name, filename],
-        print_command=False,
-        print_stdout=False,
-    ).stdout)
-    return None
-
-def write_yaml_file(filename,yamlInput):
-    data = yaml.safe_dump(yamlInput,default_style="|")
-    # `bosh int -` sorts the yaml file and ensures that we don't produce
-    # unnecessary changes.
-    data = subprocess_helper.exec_subprocess(
-        command=["bosh","int","-"],
-        print_command=False,print_stdout=False, stdin=data).stdout
+    command = ["lscrypt", "read", "-d", component_name, filename]
+    # The YAML is parsed while lscrypt is still writing it, without buffering
+    # the whole output first.
+    with subprocess.Popen(command, stdout=subprocess.PIPE) as process:
+        data = yaml.load(process.stdout, Loader=SafeLoader)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    return data
+
+def write_yaml_file(component_name, filename,yamlInput):
+    # Sort the keys and never wrap lines, so that unchanged input produces an
+    # unchanged file.
+    data = yaml.dump(yamlInput,Dumper=_SortedDumper,sort_keys=True,width=1_000_000)
     subprocess_helper.exec_subprocess(
-        command=["lscrypt", "write", "-d", "landscape-credhub/core", filename],
+        command=["lscrypt", "write", "-d", component_name, filename],
         print_command=False,
         print_stdout=False,
         stdin=data
     )
 class LscryptFile:
-    def __init__(self, filename):
+    def __init__(self, component_name, filename):
+        self.component_name = component_name
         self.filename = filename
     def read_yaml(self):
-        return read_yaml_file(filename=self.filename)
+        return read_yaml_file(self.component_name, self.filename)
     def write_yaml(self,yamlInput):
-        return write_yaml_file(filename=self.filename,yamlInput=yamlInput)
+        return write_yaml_file(self.component_name, self.filename, yamlInput)
 
 def vars_store_file():
-    return LscryptFile("vars-store.yml")
+    return LscryptFile("landscape-credhub/core", "vars-store.yml")
@@ -1,106 +1,438 @@
+import asyncio
 import base64
-import json
+import hashlib
+import logging
+import functools
 import os
-import subprocess
+import random
 import time
 
+import aiohttp
+import httpx
 import yaml
-from kubernetes import client, config
+from kubernetes_asyncio import client, config, watch
+
+from . import common
+from .httpx_rest import HttpxRESTClient
+
+try:
+    import orjson
+except ImportError:
+    # Only orjson.loads is used, and json.loads accepts bytes as well.
+    import json as orjson
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+log = logging.getLogger(__name__)
+
+# Size of the connection pool shared by all helpers using the same kubeconfig.
+CONNECTION_POOL_MAXSIZE = int(os.environ.get("GARDENER_CONNECTION_POOL_MAXSIZE", "32"))
+# Send API requests over HTTP/2 with httpx; set GARDENER_HTTP2=0 to use aiohttp instead.
+USE_HTTP2 = os.environ.get("GARDENER_HTTP2", "1") != "0"
+# Annotation Gardener requires on a shoot before it may be deleted.
+DELETION_CONFIRMATION_ANNOTATION = "confirmation.gardener.cloud/deletion"
+# HTTP status codes of API errors that are worth retrying.
+RETRIABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Connection errors that are worth retrying, raised by the aiohttp and the httpx
+# transport respectively; httpx.TransportError includes its timeouts.
+CONNECTION_ERRORS = (aiohttp.ClientError, httpx.TransportError, asyncio.TimeoutError)
+
+# Time (in seconds) for which a retrieved shoot resource is reused.
+SHOOT_CACHE_TTL = 2.0
+# Time (in seconds) before its expiration at which a shoot kubeconfig is no longer reused.
+KUBECONFIG_EXPIRY_MARGIN = 60
+
+# Directory of this module, and the component directory containing its deployments.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_BASE_DIR = os.path.normpath(os.path.join(_SCRIPT_DIR, "../../../.."))
+# Shoot templates, by cloud provider.
+_TEMPLATES_DIR = os.path.join(_BASE_DIR, "deployments/cluster/templates")
+_PROVIDER_TEMPLATES = {
+    provider: os.path.join(_TEMPLATES_DIR, f"shoot-{provider}.yml")
+    for provider in ("aws", "azure", "gcp")
+}
+# Directory in which 'iac -d cluster context' generates the cluster context file.
+_CONTEXT_BASE_DIR = os.path.normpath(os.path.join(_SCRIPT_DIR, "../../../../../../.."))
+_CTX_PATH = os.path.join(_CONTEXT_BASE_DIR, "deployments/cluster/gen/ctx.yml")
+
+# API clients shared by all helpers, keyed by kubeconfig path and modification time.
+_api_clients = {}
+# Base directories for which the cluster context was generated in this process.
+_generated_contexts = set()
+
+
+def _prune(value):
+    """
+    Remove null values from a resource tree.
+
+    The API server treats a null field like an omitted one, so pruning them only
+    shrinks the request body. Empty strings, maps and lists are kept, because
+    they can be meaningful (e.g. an empty label value).
+
+    :param value: A resource object, or any value within it.
+    :return: The value without null map entries.
+    """
+    if isinstance(value, dict):
+        return {k: _prune(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_prune(v) for v in value]
+    return value
+
+
+def _last_operation_state(shoot, default):
+    """
+    Read status.lastOperation.state from a shoot resource in a single pass.
+
+    :param shoot: The shoot resource object, or None.
+    :param default: The state to return if the last operation has no state.
+    :return: The state, or None if the shoot has no last operation.
+    """
+    last_operation = ((shoot or {}).get("status") or {}).get("lastOperation")
+    if last_operation is None:
+        return None
+    return last_operation.get("state", default)
+
+
+async def _new_api_client(configuration):
+    """
+    Create an API client, sending its requests over HTTP/2 if USE_HTTP2 is set.
+
+    :param configuration: The client configuration.
+    :return: The API client.
+    """
+    api_client = client.ApiClient(configuration)
+    if USE_HTTP2:
+        await api_client.rest_client.close()
+        api_client.rest_client = HttpxRESTClient(
+            configuration, max_connections=configuration.connection_pool_maxsize
+        )
+    return api_client
+
+
+async def _get_api_client(kubeconfig_path):
+    """
+    Return the API client for the given kubeconfig, creating it on first use.
+
+    Helpers for the same kubeconfig share one client, so the kubeconfig is loaded
+    once and connections are kept alive across helpers and requests. The client is
+    keyed by the file's modification time as well, so a rewritten kubeconfig is
+    loaded again.
+
+    :param kubeconfig_path: Path to the kubeconfig file.
+    :return: The shared API client.
+    """
+    key = (kubeconfig_path, os.stat(kubeconfig_path).st_mtime_ns)
+    api_client = _api_clients.get(key)
+    if api_client is None:
+        configuration = client.Configuration()
+        await config.load_kube_config(
+            config_file=kubeconfig_path, client_configuration=configuration
+        )
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        new_api_client = await _new_api_client(configuration)
+        api_client = _api_clients.setdefault(key, new_api_client)
+        if api_client is not new_api_client:
+            # Another helper created the client while the kubeconfig was loading.
+            await new_api_client.close()
+    return api_client
+
+
+async def close_api_clients():
+    """
+    Close all shared API clients and their connection pools.
+    """
+    while _api_clients:
+        _, api_client = _api_clients.popitem()
+        await api_client.close()
+
+
+def run(coro):
+    """
+    Run a coroutine from synchronous code and close the shared API clients afterwards.
+
+    :param coro: The coroutine to run, e.g. GardenerHelper.poll_shoot_status().
+    :return: The result of the coroutine.
+    """
+
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await close_api_clients()
+
+    return asyncio.run(run_and_close())
+
+
+async def _generate_context(base_dir):
+    """
+    Generate the cluster context with 'iac -d cluster context'.
+
+    The context is generated at most once per process and base directory; a
+    failed run is retried on the next call. It is always generated once, because
+    it also depends on inputs without a file to compare against, such as the
+    iaas-provider import and the credentials read through lscrypt.
+
+    :param base_dir: The directory containing the deployments directory.
+    :return: True if the context was generated, False otherwise.
+    """
+    if base_dir in _generated_contexts:
+        return True
+    process = await asyncio.create_subprocess_exec("iac", "-d", "cluster", "context")
+    returncode = await process.wait()
+    if returncode == 0:
+        log.info("Successfully generated context")
+        _generated_contexts.add(base_dir)
+        return True
+    log.warning(
+        "Failed to generate context: 'iac -d cluster context' exited with status %s",
+        returncode,
+    )
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _read_cloud_provider(ctx_path, mtime_ns):
+    """
+    Read the cloud provider type from a context file.
+
+    The result is cached per file and modification time, so an unchanged
+    context file is parsed only once.
+
+    :param ctx_path: Path to the ctx.yml file.
+    :param mtime_ns: Modification time of the file, used as cache key.
+    :return: The cloud provider type or None if the context does not contain it.
+    """
+    ctx_data = common.load_yaml_cached(ctx_path)
+
+    # Try to determine provider from context structure
+    try:
+        return ctx_data['context']['imports']['iaas_provider']['landscape']['type']
+    except (KeyError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_shoot_template(provider_type):
+    """
+    Find the shoot template for a cloud provider.
+
+    The result is cached, so the template locations are probed only once per process.
+    The templates directory is listed once instead of probing each candidate.
+
+    :param provider_type: The cloud provider type.
+    :return: Path to the template
+    :raises: FileNotFoundError if no suitable template could be found
+    """
+    try:
+        with os.scandir(_TEMPLATES_DIR) as entries:
+            templates = {entry.path for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        # If no templates directory found, check if there's a shoot.yml directly in the deployments directory
+        shoot_yml_path = os.path.join(_BASE_DIR, "deployments/cluster/shoot.yml")
+        if os.path.exists(shoot_yml_path):
+            log.info("No templates directory found, but found shoot.yml at: %s", shoot_yml_path)
+            return shoot_yml_path
+
+        # If we still don't have a template, raise an error
+        raise FileNotFoundError(f"Could not find templates directory or shoot.yml. Create the templates directory at {_TEMPLATES_DIR} with cloud-specific templates.") from None
+    log.debug("Found templates directory at: %s", _TEMPLATES_DIR)
+
+    # Look for a template for the detected provider
+    template_path = _PROVIDER_TEMPLATES.get(provider_type) or os.path.join(
+        _TEMPLATES_DIR, f"shoot-{provider_type}.yml"
+    )
+    if template_path in templates:
+        return template_path
+    log.warning("Template for provider '%s' not found at %s", provider_type, template_path)
+
+    # Check if there's a generic shoot.yml in the templates directory
+    generic_template = os.path.join(_TEMPLATES_DIR, "shoot.yml")
+    if generic_template in templates:
+        log.info("Using generic shoot.yml template: %s", generic_template)
+        return generic_template
+
+    # Try to find any template for any provider
+    for provider, alt_template in _PROVIDER_TEMPLATES.items():
+        if alt_template in templates:
+            log.warning(
+                "Using template for '%s' instead of '%s': %s. "
+                "Please create a template specific to '%s' for future deployments.",
+                provider,
+                provider_type,
+                alt_template,
+                provider_type,
+            )
+            return alt_template
+
+    # If we still don't have a template, raise an error
+    raise FileNotFoundError(f"Could not find template for '{provider_type}' provider. Please create {template_path} based on your shoot.yml configuration.")
 
 
 class GardenerHelper:
-    def __init__(self, kubeconfig_path, namespace, shoot_name):
+    def __init__(self, kubeconfig_path, namespace, shoot_name, api_client):
         """
         Initialize the GardenerHelper object.
 
+        Use GardenerHelper.create to get the shared API client for the kubeconfig.
+
         :param kubeconfig_path: Path to the kubeconfig file.
         :param namespace: The namespace where the shoot resource resides.
         :param shoot_name: The name of the shoot resource.
+        :param api_client: The API client configured from the kubeconfig.
         """
         self.kubeconfig_path = kubeconfig_path
         self.namespace = namespace
         self.shoot_name = shoot_name
+        self.api_client = api_client
+        self.custom_api = client.CustomObjectsApi(api_client)
+        # Keyword arguments addressing the shoot resources in the namespace.
+        self._shoot_ref = {
+            "group": "core.gardener.cloud",
+            "version": "v1beta1",
+            "namespace": namespace,
+            "plural": "shoots",
+        }
+        # Path of the shoot resource for raw API requests.
+        self._shoot_path = (
+            f"/apis/core.gardener.cloud/v1beta1/namespaces/{namespace}/shoots/{shoot_name}"
+        )
+        # Last seen shoot resource as a (monotonic time, shoot) tuple.
+        self._shoot_cache = None
+        # In-flight retrieval of the shoot resource shared by concurrent cached reads.
+        self._shoot_fetch = None
+        # Incremented on invalidation, so retrievals started before do not fill the cache.
+        self._shoot_generation = 0
+        # Last logged lastOperation.state, so only state transitions are logged.
+        self._last_state = None
+        # Last retrieved shoot kubeconfig as a (valid until, kubeconfig, shoot API client)
+        # tuple; the shoot API client is owned by the helper.
+        self._kubeconfig_cache = None
+        # In-flight kubeconfig request shared by concurrent get_shoot_kubeconfig calls.
+        self._kubeconfig_fetch = None
+        # Cloud provider and shoot template, determined on first use.
+        self._provider = None
+        self._template_path = None
+
+    @classmethod
+    async def create(cls, kubeconfig_path, namespace, shoot_name):
+        """
+        Create a GardenerHelper object using the shared API client for the kubeconfig.
+
+        The shared API clients are closed with close_api_clients().
+
+        :param kubeconfig_path: Path to the kubeconfig file.
+        :param namespace: The namespace where the shoot resource resides.
+        :param shoot_name: The name of the shoot resource.
+        :return: The GardenerHelper object.
+        """
+        api_client = await _get_api_client(kubeconfig_path)
+        return cls(kubeconfig_path, namespace, shoot_name, api_client)
+
+    async def close(self):
+        """
+        Close the API client for the shoot cluster, if one was created.
 
-        # Load the kubeconfig and create the CustomObjectsApi instance.
-        config.load_kube_config(config_file=self.kubeconfig_path)
-        self.custom_api = client.CustomObjectsApi()
+        The shared API client for the kubeconfig is left open; see close_api_clients().
+        """
+        if self._kubeconfig_cache is not None:
+            _, _, shoot_api_client = self._kubeconfig_cache
+            self._kubeconfig_cache = None
+            await shoot_api_client.close()
+
+    def invalidate_kubeconfig(self):
+        """
+        Stop reusing the last retrieved shoot kubeconfig, e.g. after it was revoked.
+
+        The next get_shoot_kubeconfig call requests a new kubeconfig.
+        """
+        if self._kubeconfig_cache is not None:
+            _, kubeconfig, shoot_api_client = self._kubeconfig_cache
+            self._kubeconfig_cache = (0.0, kubeconfig, shoot_api_client)
+
+    def invalidate_shoot_cache(self):
+        """
+        Stop reusing the last seen shoot resource, e.g. after it was changed elsewhere.
+
+        The next cached read sends a new GET instead of joining one already in flight,
+        and GETs already in flight no longer fill the cache.
+        """
+        self._shoot_cache = None
+        self._shoot_fetch = None
+        self._shoot_generation += 1
 
-    def safe_call_with_retries(self, func, max_retries=3, interval=10):
+    async def safe_call_with_retries(
+        self, func, max_retries=3, interval=10, max_interval=60
+    ):
         """
         Safely call a function with retries.
+
+        The delay between retries doubles from interval up to max_interval, plus a
+        random jitter of up to half the interval so that concurrent callers do not
+        retry in lockstep. Only connection errors and API errors with a status in
+        RETRIABLE_STATUS_CODES are retried; any other error is raised immediately.
+
         :param func: The function to call.
         :param max_retries: The maximum number of retries.
-        :param interval: Time (in seconds) between each retry.
+        :param interval: Time (in seconds) before the first retry.
+        :param max_interval: Upper bound (in seconds) of the delay between retries.
         :return: The result of the function call.
         """
         retries = 0
         while retries < max_retries:
             try:
-                return func()
-            except Exception as e:
-                print(f"Error occurred: {e}")
+                return await func()
+            except (client.exceptions.ApiException, *CONNECTION_ERRORS) as e:
+                if (
+                    isinstance(e, client.exceptions.ApiException)
+                    and e.status not in RETRIABLE_STATUS_CODES
+                ):
+                    raise
+                log.warning("Error occurred: %s", e)
+                delay = min(max_interval, interval * 2**retries)
                 retries += 1
-                time.sleep(interval)
+                if retries < max_retries:
+                    await asyncio.sleep(delay + random.uniform(0, interval / 2))
         raise Exception("Max retries exceeded. Aborting operation.")
 
-    def determine_cloud_provider(self):
+    async def determine_cloud_provider(self):
         """
         Determine the cloud provider from the context.
         :return: The cloud provider type (aws, azure, gcp, etc.) or None if it couldn't be determined
         """
+        if self._provider is not None:
+            return self._provider
+
         # First, ensure the context is generated
-        try:
-            subprocess.run(["iac", "-d", "cluster", "context"], check=True)
-            print("Successfully generated context")
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Failed to generate context: {e}")
-            print("Will try to use existing context file if available")
-        
-        # Get the path to the ctx.yml file
-        # Using relative path from the known locations
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        base_dir = os.path.normpath(os.path.join(script_dir, "../../../../../../.."))  
-        
-        # Try to find ctx.yml in common locations
-        possible_ctx_paths = [
-            os.path.join(base_dir, "deployments/cluster/gen/ctx.yml")
-        ]
-        
-        ctx_path = None
-        for path in possible_ctx_paths:
-            norm_path = os.path.normpath(path)
-            if os.path.exists(norm_path):
-                ctx_path = norm_path
-                print(f"Found context file at: {ctx_path}")
-                break
-        
-        if not ctx_path:
-            print("Could not find context file. Please ensure 'iac -d cluster context' has been run.")
+        if not await _generate_context(_CONTEXT_BASE_DIR):
+            log.info("Will try to use existing context file if available")
+
+        ctx_path = _CTX_PATH
+        if not os.path.exists(ctx_path):
+            log.warning(
+                "Could not find context file. Please ensure 'iac -d cluster context' has been run."
+            )
             return None
+        log.debug("Found context file at: %s", ctx_path)
         
         # Read and parse the context file
         try:
-            with open(ctx_path, 'r') as f:
-                ctx_data = yaml.safe_load(f)
-                
-            # Try to determine provider from context structure
-            if 'context' in ctx_data and 'imports' in ctx_data['context'] and 'iaas_provider' in ctx_data['context']['imports']:
-                provider_data = ctx_data['context']['imports']['iaas_provider']
-                
-                if 'landscape' in provider_data and 'type' in provider_data['landscape']:
-                    provider_type = provider_data['landscape']['type']
-                    print(f"Detected cloud provider from ctx.yml: {provider_type}")
-                    return provider_type
-        
-            # If we couldn't extract the provider from the expected structure, log it
-            print("Could not determine cloud provider from context structure.")
-            return None
-        
+            provider_type = _read_cloud_provider(ctx_path, os.stat(ctx_path).st_mtime_ns)
         except Exception as e:
-            print(f"Error reading context file {ctx_path}: {e}")
+            log.error("Error reading context file %s: %s", ctx_path, e)
             return None
 
-    def select_shoot_template(self):
+        if provider_type:
+            log.info("Detected cloud provider from ctx.yml: %s", provider_type)
+        else:
+            # If we couldn't extract the provider from the expected structure, log it
+            log.warning("Could not determine cloud provider from context structure.")
+        self._provider = provider_type
+        return provider_type
+
+    async def select_shoot_template(self):
         """
         Select the appropriate shoot template based on the cloud provider.
         
@@ -108,69 +440,20 @@ class GardenerHelper:
         :raises: ValueError if cloud provider couldn't be determined
         :raises: FileNotFoundError if no suitable template could be found
         """
-        
+        if self._template_path is not None:
+            return self._template_path
+
         # Determine the cloud provider
-        provider_type = self.determine_cloud_provider()
+        provider_type = await self.determine_cloud_provider()
         if not provider_type:
             raise ValueError("Cloud provider could not be determined from context. Please specify a template file directly.")
             
-        # Build paths relative to the script location
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        base_dir = os.path.normpath(os.path.join(script_dir, "../../../.."))
-        
-        # Define possible locations for templates
-        templates_dirs = [
-            os.path.join(base_dir, "deployments/cluster/templates"),
-        ]
-        
-        # Find the first templates directory that exists
-        templates_dir = None
-        for dir_path in templates_dirs:
-            norm_path = os.path.normpath(dir_path)
-            if os.path.exists(norm_path) and os.path.isdir(norm_path):
-                templates_dir = norm_path
-                print(f"Found templates directory at: {templates_dir}")
-                break
-                
-        if not templates_dir:
-            # If no templates directory found, check if there's a shoot.yml directly in the deployments directory
-            deployments_dir = os.path.join(base_dir, "deployments/cluster")
-            shoot_yml_path = os.path.join(deployments_dir, "shoot.yml")
-            
-            if os.path.exists(shoot_yml_path):
-                print(f"No templates directory found, but found shoot.yml at: {shoot_yml_path}")
-                return shoot_yml_path
-                
-            # If we still don't have a template, raise an error
-            raise FileNotFoundError(f"Could not find templates directory or shoot.yml. Create the templates directory at {templates_dirs[0]} with cloud-specific templates.")
-            
-        # Look for a template for the detected provider
-        template_path = os.path.join(templates_dir, f"shoot-{provider_type}.yml")
-        
-        if not os.path.exists(template_path):
-            print(f"Template for provider '{provider_type}' not found at {template_path}")
-            
-            # Check if there's a generic shoot.yml in the templates directory
-            generic_template = os.path.join(templates_dir, "shoot.yml")
-            if os.path.exists(generic_template):
-                print(f"Using generic shoot.yml template: {generic_template}")
-                return generic_template
-                
-            # Try to find any template for any provider
-            for provider in ["aws", "azure", "gcp"]:
-                alt_template = os.path.join(templates_dir, f"shoot-{provider}.yml")
-                if os.path.exists(alt_template):
-                    print(f"Warning: Using template for '{provider}' instead of '{provider_type}': {alt_template}")
-                    print(f"Please create a template specific to '{provider_type}' for future deployments.")
-                    return alt_template
-                
-            # If we still don't have a template, raise an error
-            raise FileNotFoundError(f"Could not find template for '{provider_type}' provider. Please create {template_path} based on your shoot.yml configuration.")
-
-        print(f"Selected template for '{provider_type}' provider: {template_path}")
+        template_path = _resolve_shoot_template(provider_type)
+        log.info("Selected template for '%s' provider: %s", provider_type, template_path)
+        self._template_path = template_path
         return template_path
 
-    def create_shoot(self, template_file_path=None, template_string=None):
+    async def create_shoot(self, template_file_path=None, template_string=None):
         """
         Create a shoot resource from a YAML template.
 
@@ -186,214 +469,386 @@ class GardenerHelper:
         if not template_string and not template_file_path:
             try:
                 # Try to select a template
-                template_file_path = self.select_shoot_template()
-                print(f"Automatically selected template: {template_file_path}")
+                template_file_path = await self.select_shoot_template()
+                log.info("Automatically selected template: %s", template_file_path)
             except Exception as e:
                 error_msg = f"Error selecting template: {e}"
-                print(error_msg)
+                log.error(error_msg)
                 raise ValueError(f"{error_msg}. Please provide a template_file_path or template_string explicitly.")
             
         if template_string:
-            shoot_template = yaml.safe_load(template_string)
+            shoot_template = yaml.load(template_string, Loader=SafeLoader)
         elif template_file_path:
             if not os.path.exists(template_file_path):
                 raise FileNotFoundError(f"Template file does not exist: {template_file_path}")
                 
-            with open(template_file_path, "r") as f:
-                shoot_template = yaml.safe_load(f)
+            shoot_template = common.load_yaml_cached(template_file_path)
         else:
             raise ValueError("Either template_file_path or template_string must be provided.")
 
         try:
-            created_shoot = self.custom_api.create_namespaced_custom_object(
-                group="core.gardener.cloud",
-                version="v1beta1",
-                namespace=self.namespace,
-                plural="shoots",
-                body=shoot_template,
+            created_shoot = await self.custom_api.create_namespaced_custom_object(
+                **self._shoot_ref,
+                body=_prune(shoot_template),
             )
-            print(f"Shoot resource '{self.shoot_name}' creation initiated.")
+            log.info("Shoot resource '%s' creation initiated.", self.shoot_name)
+            self._cache_shoot(created_shoot)
             return created_shoot
         except Exception as e:
-            print("Error creating shoot resource:", e)
+            log.error("Error creating shoot resource: %s", e)
             raise
 
-    def get_shoot(self):
+    def _cache_shoot(self, shoot, generation=None):
+        """
+        Remember the last seen state of the shoot resource.
+
+        :param shoot: The shoot resource object, or None if it does not exist.
+        :param generation: The cache generation when the shoot was requested; the shoot
+                           is not remembered if the cache was invalidated since.
+        """
+        if generation is None or generation == self._shoot_generation:
+            self._shoot_cache = (time.monotonic(), shoot)
+
+    async def _get_shoot_cached(self, ttl=SHOOT_CACHE_TTL):
+        """
+        Retrieve the shoot resource, reusing the last seen state if it is recent enough.
+
+        Concurrent callers share a single in-flight request, so reads issued
+        together (e.g. through asyncio.gather) cost one GET.
+
+        :param ttl: Maximum age (in seconds) of a reused shoot resource; 0 always refreshes.
+        :return: The shoot resource object if it exists; otherwise, None.
+        """
+        if self._shoot_cache is not None:
+            seen_at, shoot = self._shoot_cache
+            if time.monotonic() - seen_at < ttl:
+                return shoot
+        if self._shoot_fetch is None:
+            self._shoot_fetch = asyncio.ensure_future(self.get_shoot())
+            self._shoot_fetch.add_done_callback(self._clear_shoot_fetch)
+        return await asyncio.shield(self._shoot_fetch)
+
+    def _clear_shoot_fetch(self, fetch):
+        if self._shoot_fetch is fetch:
+            self._shoot_fetch = None
+
+    async def _get_shoot_response(self):
+        """
+        Send a GET request for the shoot resource without reading the response body.
+
+        A missing shoot resource is detected from the status code, so the common
+        404 case while waiting for a deletion does not raise and catch an exception.
+
+        :return: The unread response, or None if the shoot resource does not exist.
+        :raises: ApiException for any other non-2xx status.
+        """
+        response = await self.api_client.call_api(
+            resource_path=self._shoot_path,
+            method="GET",
+            header_params={"Accept": "application/json"},
+            auth_settings=["BearerToken"],
+            _preload_content=False,
+            _return_http_data_only=True,
+        )
+        if 200 <= response.status <= 299:
+            return response
+        response.release()
+        if response.status == 404:
+            log.debug("Shoot resource '%s' does not exist.", self.shoot_name)
+            return None
+        raise client.exceptions.ApiException(
+            status=response.status, reason=response.reason
+        )
+
+    async def get_shoot(self):
         """
         Retrieve the shoot resource.
 
         :return: The shoot resource object if it exists; otherwise, None.
         """
+        generation = self._shoot_generation
         try:
-            shoot = self.custom_api.get_namespaced_custom_object(
-                group="core.gardener.cloud",
-                version="v1beta1",
-                namespace=self.namespace,
-                plural="shoots",
-                name=self.shoot_name,
-            )
-            return shoot
+            response = await self._get_shoot_response()
         except client.exceptions.ApiException as e:
-            if e.status == 404:
-                print(f"Shoot resource '{self.shoot_name}' does not exist.")
-                return None
-            else:
-                print("Error retrieving shoot resource:", e)
-                raise
+            log.error("Error retrieving shoot resource: %s", e)
+            raise
+        shoot = None
+        if response is not None:
+            try:
+                shoot = orjson.loads(await response.read())
+            finally:
+                response.release()
+        self._cache_shoot(shoot, generation)
+        return shoot
 
-    def shoot_exists(self):
+    async def shoot_exists(self):
         """
         Check if the shoot resource exists.
 
         :return: True if it exists, False otherwise.
         """
-        return self.get_shoot() is not None
+        return await self._get_shoot_cached() is not None
 
-    def poll_shoot_status(self, timeout=300, interval=10):
+    async def list_shoot(self):
         """
-        Poll the status of the shoot resource.
+        List the shoot resource through a field selector on its name.
+
+        Unlike get_shoot, the list response carries a collection resourceVersion
+        from which a watch can be started without missing any events.
+
+        :return: A tuple (shoot, resource_version) where shoot is None if it does not exist.
+        """
+        shoots = await self.custom_api.list_namespaced_custom_object(
+            **self._shoot_ref,
+            field_selector=f"metadata.name={self.shoot_name}",
+        )
+        items = shoots.get("items") or []
+        return (items[0] if items else None), shoots["metadata"]["resourceVersion"]
+
+    async def watch_shoot(self, timeout=300, interval=10):
+        """
+        Watch the shoot resource and yield its events until the timeout elapses.
+
+        The current state is listed first and yielded as a "SYNC" event (with None
+        as object if the shoot does not exist). Events are then streamed from the
+        listed resourceVersion; when the server closes the stream, the watch resumes
+        from the last seen resourceVersion, and when that version has expired
+        (410 Gone) the shoot is listed again. Bookmark events keep the last seen
+        resourceVersion current while the shoot does not change, so a resumed
+        watch rarely needs to list it again. Every observed state is cached for
+        the cached reads of shoot_exists and check_shoot_health.
+
+        If the list or the watch fails with a retriable error, or the stream closes
+        without any event, the watch is resumed after a delay that grows from one
+        second by half each time up to interval, and is reset by the next event.
+
+        :param timeout: Total time (in seconds) to watch before giving up.
+        :param interval: Upper bound (in seconds) of the delay before resuming the watch.
+        :return: An async generator of (event_type, shoot) tuples.
+        """
+        deadline = time.monotonic() + timeout
+        resource_version = None
+        delay = None
+        while time.monotonic() < deadline:
+            if delay is not None:
+                await asyncio.sleep(max(0, min(delay, deadline - time.monotonic())))
+            delay = min(interval, max(1.0, (delay or 0) * 1.5))
+            try:
+                if resource_version is None:
+                    shoot, resource_version = await self.list_shoot()
+                    self._cache_shoot(shoot)
+                    yield "SYNC", shoot
+
+                async with watch.Watch() as shoot_watch:
+                    async for event in shoot_watch.stream(
+                        self.custom_api.list_namespaced_custom_object,
+                        **self._shoot_ref,
+                        field_selector=f"metadata.name={self.shoot_name}",
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=max(1, int(deadline - time.monotonic())),
+                    ):
+                        event_type, obj = event["type"], event["object"]
+                        resource_version = obj["metadata"]["resourceVersion"]
+                        delay = None
+                        if event_type != "BOOKMARK":
+                            self._cache_shoot(None if event_type == "DELETED" else obj)
+                            yield event_type, obj
+            except client.exceptions.ApiException as e:
+                # The watch raises ERROR events, e.g. an expired resourceVersion, as ApiException.
+                if e.status == 410:
+                    log.debug("Shoot watch expired, listing shoot resource again.")
+                    resource_version = None
+                    delay = None
+                elif e.status in RETRIABLE_STATUS_CODES:
+                    log.warning("Shoot watch failed, resuming in %.1fs: %s", delay, e)
+                else:
+                    raise
+            except CONNECTION_ERRORS as e:
+                log.warning("Shoot watch failed, resuming in %.1fs: %s", delay, e)
+
+    async def poll_shoot_status(self, timeout=300, interval=10):
+        """
+        Wait for the shoot resource to reach a conclusive state.
+
+        The shoot is watched rather than polled, so this returns as soon as the
+        state change is observed.
 
         Returns:
             - True if the shoot's lastOperation.state is 'Succeeded',
             - False if it is 'Failed',
-            - "in-progress" if polling times out without a conclusive state.
+            - "in-progress" if the timeout elapses without a conclusive state.
 
-        :param timeout: Total time (in seconds) to poll before giving up.
-        :param interval: Time (in seconds) between each poll.
+        :param timeout: Total time (in seconds) to wait before giving up.
+        :param interval: Upper bound (in seconds) of the delay before resuming the watch.
         :return: True, False, or "in-progress"
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            shoot = self.get_shoot()
-            if shoot and "status" in shoot and "lastOperation" in shoot["status"]:
-                state = shoot["status"]["lastOperation"].get("state", "Progressing")
-                print(f"Current shoot state: {state}")
+        async for event_type, shoot in self.watch_shoot(timeout=timeout, interval=interval):
+            if event_type == "DELETED":
+                log.warning("Shoot resource '%s' has been deleted.", self.shoot_name)
+                return False
+            state = _last_operation_state(shoot, "Progressing")
+            if state is not None:
+                if state != self._last_state:
+                    log.info("Current shoot state: %s", state)
+                    self._last_state = state
                 if state.lower() == "succeeded":
                     return True
                 elif state.lower() == "failed":
                     return False
             else:
-                print(f"Status not available yet for shoot: {self.shoot_name}")
-            time.sleep(interval)
+                log.debug("Status not available yet for shoot: %s", self.shoot_name)
         return "in-progress"
 
-    def poll_shoot_deletion_status(self, timeout=300, interval=10):
+    async def poll_shoot_deletion_status(self, timeout=300, interval=10):
         """
-        Poll for the deletion of the shoot resource.
+        Wait for the deletion of the shoot resource.
+
+        The shoot is watched rather than polled, so this returns as soon as the
+        deletion is observed.
 
         Returns:
             - True if the shoot resource is confirmed deleted,
             - "in-progress" if deletion is still ongoing after the timeout.
 
-        :param timeout: Total time (in seconds) to poll for deletion.
-        :param interval: Time (in seconds) between each poll.
+        :param timeout: Total time (in seconds) to wait for deletion.
+        :param interval: Upper bound (in seconds) of the delay before resuming the watch.
         :return: True or "in-progress"
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Try to retrieve the shoot; if it exists, deletion is not complete.
-                self.custom_api.get_namespaced_custom_object(
-                    group="core.gardener.cloud",
-                    version="v1beta1",
-                    namespace=self.namespace,
-                    plural="shoots",
-                    name=self.shoot_name,
+        async for event_type, shoot in self.watch_shoot(timeout=timeout, interval=interval):
+            if event_type == "DELETED" or (event_type == "SYNC" and shoot is None):
+                log.info(
+                    "Shoot resource '%s' has been deleted successfully.", self.shoot_name
                 )
-                print(f"Shoot resource '{self.shoot_name}' still exists.")
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    print(
-                        f"Shoot resource '{self.shoot_name}' has been deleted successfully."
-                    )
-                    return True
-                else:
-                    print("Error while polling deletion status:", e)
-            time.sleep(interval)
+                return True
+            log.debug("Shoot resource '%s' still exists.", self.shoot_name)
         return "in-progress"
 
-    def check_shoot_health(self):
+    async def check_shoot_health(self):
         """
         Check the health of the shoot resource.
 
         Returns:
             The health status if available, otherwise the last operation state or a message.
         """
-        shoot = self.get_shoot()
+        shoot = await self._get_shoot_cached()
         if shoot and "status" in shoot:
             # Prefer a dedicated health field if present.
             health = shoot["status"].get("health", None)
             if health:
-                print(f"Shoot health: {health}")
+                log.debug("Shoot health: %s", health)
                 return health
             # Fallback to the last operation state.
-            if "lastOperation" in shoot["status"]:
-                state = shoot["status"]["lastOperation"].get("state", "Unknown")
-                print(f"Shoot last operation state: {state}")
+            state = _last_operation_state(shoot, "Unknown")
+            if state is not None:
+                log.debug("Shoot last operation state: %s", state)
                 return state
             return "Status available but no health info"
         return "No status available"
 
-    def delete_shoot(self):
+    async def delete_shoot(self):
         """
         Delete the shoot resource.
 
         First, it annotates the resource with
             confirmation.gardener.cloud/deletion=true
         (as required for deletion), then it initiates deletion in a non-blocking way.
+        Gardener rejects the deletion unless the annotation is already stored, so
+        the two requests cannot be merged or sent concurrently; the annotation
+        request is skipped when the recently seen shoot already carries it.
         """
+        annotations = {}
+        if self._shoot_cache is not None:
+            seen_at, shoot = self._shoot_cache
+            if shoot and time.monotonic() - seen_at < SHOOT_CACHE_TTL:
+                annotations = shoot["metadata"].get("annotations") or {}
+        self.invalidate_shoot_cache()
+
         # Annotate the shoot resource for deletion confirmation.
-        patch_body = {
-            "metadata": {
-                "annotations": {"confirmation.gardener.cloud/deletion": "true"}
-            }
-        }
-        try:
-            self.custom_api.patch_namespaced_custom_object(
-                group="core.gardener.cloud",
-                version="v1beta1",
-                namespace=self.namespace,
-                plural="shoots",
-                name=self.shoot_name,
-                body=patch_body,
-            )
-            print(
-                f"Annotation added to shoot resource '{self.shoot_name}' for deletion confirmation."
+        if annotations.get(DELETION_CONFIRMATION_ANNOTATION) == "true":
+            log.debug(
+                "Shoot resource '%s' is already annotated for deletion confirmation.",
+                self.shoot_name,
             )
-        except Exception as e:
-            print("Error patching shoot resource for deletion:", e)
-            raise
+        else:
+            patch_body = {
+                "metadata": {"annotations": {DELETION_CONFIRMATION_ANNOTATION: "true"}}
+            }
+            try:
+                await self.custom_api.patch_namespaced_custom_object(
+                    **self._shoot_ref,
+                    name=self.shoot_name,
+                    body=patch_body,
+                    # Without an explicit type the client sends a dict body as a
+                    # JSON Patch, which the API server rejects.
+                    _content_type="application/merge-patch+json",
+                )
+                log.debug(
+                    "Annotation added to shoot resource '%s' for deletion confirmation.",
+                    self.shoot_name,
+                )
+            except Exception as e:
+                log.error("Error patching shoot resource for deletion: %s", e)
+                raise
 
         # Initiate deletion (asynchronously, similar to --wait=false).
         try:
-            self.custom_api.delete_namespaced_custom_object(
-                group="core.gardener.cloud",
-                version="v1beta1",
-                namespace=self.namespace,
-                plural="shoots",
+            await self.custom_api.delete_namespaced_custom_object(
+                **self._shoot_ref,
                 name=self.shoot_name,
-                body=client.V1DeleteOptions(),
+                body=client.V1DeleteOptions(propagation_policy="Background"),
             )
-            print(
-                f"Deletion initiated for shoot resource '{self.shoot_name}' (wait disabled)."
+            log.info(
+                "Deletion initiated for shoot resource '%s' (wait disabled).",
+                self.shoot_name,
             )
         except Exception as e:
-            print("Error deleting shoot resource:", e)
+            log.error("Error deleting shoot resource: %s", e)
             raise
 
-    def get_shoot_kubeconfig(self, expiration_seconds=600):
+    async def get_shoot_kubeconfig(self, expiration_seconds=600):
         """
         Generate and retrieve the kubeconfig for the shoot cluster.
 
         This method loads the existing kubeconfig (from the instance's configuration),
         sends a request to the Gardener API to create an admin kubeconfig for the shoot,
         decodes the returned kubeconfig (which is base64 encoded), and then creates a new
-        API client for interacting with the shoot cluster.
+        API client for interacting with the shoot cluster. The shoot API client has a
+        connection pool of CONNECTION_POOL_MAXSIZE and is owned by the helper: it
+        replaces the client of a previous call and is closed by close().
+
+        The kubeconfig and API client are reused by later calls until
+        KUBECONFIG_EXPIRY_MARGIN seconds before the kubeconfig expires, or until
+        invalidate_kubeconfig() is called. Concurrent calls share a single request,
+        so they all receive the same kubeconfig and API client.
 
         :param expiration_seconds: The lifetime of the generated kubeconfig.
         :return: A tuple (decoded_kubeconfig, shoot_api_client) where decoded_kubeconfig is a string
                  and shoot_api_client is a Kubernetes API client for the shoot cluster.
         """
+        if self._kubeconfig_cache is not None:
+            valid_until, kubeconfig, shoot_api_client = self._kubeconfig_cache
+            if time.monotonic() < valid_until:
+                return kubeconfig, shoot_api_client
+
+        if self._kubeconfig_fetch is None:
+            self._kubeconfig_fetch = asyncio.ensure_future(
+                self._request_shoot_kubeconfig(expiration_seconds)
+            )
+            self._kubeconfig_fetch.add_done_callback(self._clear_kubeconfig_fetch)
+        return await asyncio.shield(self._kubeconfig_fetch)
+
+    def _clear_kubeconfig_fetch(self, fetch):
+        if self._kubeconfig_fetch is fetch:
+            self._kubeconfig_fetch = None
+
+    async def _request_shoot_kubeconfig(self, expiration_seconds):
+        """
+        Request a new shoot kubeconfig and replace the cached one with it.
+
+        :param expiration_seconds: The lifetime of the generated kubeconfig.
+        :return: A tuple (decoded_kubeconfig, shoot_api_client).
+        """
         kubeconfig_request = {
             "apiVersion": "authentication.gardener.cloud/v1alpha1",
             "kind": "AdminKubeconfigRequest",
@@ -403,63 +858,100 @@ class GardenerHelper:
         # Use the API client from the loaded kubeconfig.
         api_client = self.custom_api.api_client
         try:
-            response = api_client.call_api(
-                resource_path=f"/apis/core.gardener.cloud/v1beta1/namespaces/{self.namespace}/shoots/{self.shoot_name}/adminkubeconfig",
+            response = await api_client.call_api(
+                resource_path=f"{self._shoot_path}/adminkubeconfig",
                 method="POST",
                 body=kubeconfig_request,
                 auth_settings=["BearerToken"],
                 _preload_content=False,
                 _return_http_data_only=True,
             )
+            # Responses that are not preloaded are returned whatever their status.
+            if not 200 <= response.status <= 299:
+                response.release()
+                raise client.exceptions.ApiException(
+                    status=response.status, reason=response.reason
+                )
+            try:
+                response_body = await response.read()
+            finally:
+                response.release()
         except Exception as e:
-            print("Error requesting shoot kubeconfig:", e)
+            log.error("Error requesting shoot kubeconfig: %s", e)
             raise
 
         try:
-            response_json = json.loads(response.data)
+            response_json = orjson.loads(response_body)
             encoded_kubeconfig = response_json["status"]["kubeconfig"]
-            decoded_kubeconfig = base64.b64decode(encoded_kubeconfig).decode("utf-8")
-            print("Decoded shoot kubeconfig:")
-            print(decoded_kubeconfig)
-            shoot_config = yaml.safe_load(decoded_kubeconfig)
-            shoot_api_client = config.new_client_from_config_dict(shoot_config)
-            return decoded_kubeconfig, shoot_api_client
+            # The kubeconfig holds credentials, so only its size and digest are logged.
+            kubeconfig_bytes = base64.b64decode(encoded_kubeconfig)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Shoot kubeconfig retrieved (len=%d, sha256=%s)",
+                    len(kubeconfig_bytes),
+                    hashlib.sha256(kubeconfig_bytes).hexdigest()[:12],
+                )
+            shoot_config = yaml.load(kubeconfig_bytes, Loader=SafeLoader)
+            shoot_configuration = client.Configuration()
+            await config.load_kube_config_from_dict(
+                shoot_config, client_configuration=shoot_configuration
+            )
+            shoot_configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+            shoot_api_client = await _new_api_client(shoot_configuration)
         except Exception as e:
-            print("Error decoding shoot kubeconfig:", e)
+            # Parser errors may quote the kubeconfig, so only the error type is logged.
+            log.error("Error decoding shoot kubeconfig: %s", type(e).__name__)
             raise
 
+        await self.close()
+        kubeconfig = kubeconfig_bytes.decode("utf-8")
+        self._kubeconfig_cache = (
+            time.monotonic() + expiration_seconds - KUBECONFIG_EXPIRY_MARGIN,
+            kubeconfig,
+            shoot_api_client,
+        )
+        return kubeconfig, shoot_api_client
 
-# Example usage for local testing:
+
+# Example usage for local testing (run as a module, e.g. python -m library.python.lib.gardener):
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     kubeconfig = "./robot-kubeconfig.yml"
     namespace = "garden-perftests"
-    shoot_name = "monika-vm"
+    shoot_names = ["monika-vm"]
     template_file = "./shoot-template.yml"
 
-    # Create an instance of GardenerHelper.
-    gardener = GardenerHelper(kubeconfig, namespace, shoot_name)
-
-    # Create the shoot.
-    gardener.create_shoot(template_file_path=template_file)
-    creation_status = gardener.poll_shoot_status(timeout=300, interval=10)
-    print("Shoot creation status:", creation_status)
-
-    # Check if the shoot exists.
-    exists = gardener.shoot_exists()
-    print("Does shoot exist?", exists)
-
-    # Check the health of the shoot.
-    health = gardener.check_shoot_health()
-    print("Shoot health:", health)
-
-    # Retrieve the shoot kubeconfig and create a shoot API client.
-    kubeconfig_str, shoot_api_client = gardener.get_shoot_kubeconfig(
-        expiration_seconds=600
-    )
-    print("Retrieved shoot kubeconfig:")
-    print(kubeconfig_str)
-
-    # Delete the shoot.
-    gardener.delete_shoot()
-    deletion_status = gardener.poll_shoot_deletion_status(timeout=300, interval=10)
-    print("Shoot deletion status:", deletion_status)
+    async def shoot_lifecycle(shoot_name):
+        # Create an instance of GardenerHelper.
+        gardener = await GardenerHelper.create(kubeconfig, namespace, shoot_name)
+
+        # Create the shoot.
+        await gardener.create_shoot(template_file_path=template_file)
+        creation_status = await gardener.poll_shoot_status(timeout=300, interval=10)
+        print("Shoot creation status:", creation_status)
+
+        # Check if the shoot exists, check its health and retrieve the shoot
+        # kubeconfig concurrently. The existence and health checks share one GET.
+        exists, health, (kubeconfig_str, shoot_api_client) = await asyncio.gather(
+            gardener.shoot_exists(),
+            gardener.check_shoot_health(),
+            gardener.get_shoot_kubeconfig(expiration_seconds=600),
+        )
+        print("Does shoot exist?", exists)
+        print("Shoot health:", health)
+        print(f"Retrieved shoot kubeconfig ({len(kubeconfig_str)} characters).")
+
+        # Delete the shoot.
+        await gardener.delete_shoot()
+        deletion_status = await gardener.poll_shoot_deletion_status(
+            timeout=300, interval=10
+        )
+        print("Shoot deletion status:", deletion_status)
+        await gardener.close()
+
+    async def main():
+        # Shoot lifecycles share the event loop and the API client, and run concurrently.
+        await asyncio.gather(*(shoot_lifecycle(name) for name in shoot_names))
+
+    run(main())
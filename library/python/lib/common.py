@@ -1,7 +1,19 @@
+import asyncio
 import os
 import subprocess
+import tempfile
 
-import landscape_tools
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 def run_spiff_merge(definition_dir, gen_dir, file_name):
@@ -10,7 +22,82 @@ def run_spiff_merge(definition_dir, gen_dir, file_name):
     file_path = f"{definition_dir}/{file_name}"
     target_file_path = f"{gen_dir}/{file_name}"
     spiff_merge_cmd = f"{spiff_bin} merge {file_path} {context_file_path}".split()
-    merged_file = landscape_tools.exec_subprocess(spiff_merge_cmd, capture_stdout=True).stdout
-    with open(target_file_path, "w") as shoot_file:
-        shoot_file.write(merged_file)
+    # spiff writes the merged file straight into a temporary file, so the
+    # merged YAML is never held in memory; it replaces the target file only
+    # if the merge succeeds.
+    with tempfile.NamedTemporaryFile("wb", dir=gen_dir, delete=False) as shoot_file:
+        try:
+            subprocess.run(spiff_merge_cmd, stdout=shoot_file, check=True)
+        except BaseException:
+            shoot_file.close()
+            os.unlink(shoot_file.name)
+            raise
+    os.replace(shoot_file.name, target_file_path)
     return target_file_path
+
+
+def load_yaml_cached(path):
+    """
+    Load a YAML file, reusing a JSON copy of its content written next to it.
+
+    The YAML file stays the source of truth: the JSON sidecar records the size and
+    modification time of the YAML file it was created from and is only used while
+    both still match. Otherwise the YAML file is parsed and the sidecar is replaced
+    atomically. Content that does not survive the round trip through JSON unchanged
+    is not cached, a sidecar that cannot be written is skipped, and no sidecar is
+    used without orjson.
+
+    :param path: Path to the YAML file.
+    :return: The parsed content of the file.
+    """
+    if orjson is None:
+        with open(path, "r") as yaml_file:
+            return yaml.load(yaml_file, Loader=SafeLoader)
+
+    sidecar_path = f"{path}.json"
+    stat = os.stat(path)
+    source = [stat.st_size, stat.st_mtime_ns]
+    try:
+        with open(sidecar_path, "rb") as sidecar_file:
+            sidecar = orjson.loads(sidecar_file.read())
+        if sidecar["source"] == source:
+            return sidecar["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path, "r") as yaml_file:
+        data = yaml.load(yaml_file, Loader=SafeLoader)
+    try:
+        payload = orjson.dumps(
+            {"source": source, "data": data}, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    except TypeError:
+        # YAML values without a JSON equivalent (e.g. timestamps) are not cached.
+        return data
+    if orjson.loads(payload)["data"] != data:
+        # orjson writes inf and nan as null; such content is not cached either.
+        return data
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=os.path.dirname(sidecar_path) or ".", delete=False
+        ) as sidecar_file:
+            sidecar_file.write(payload)
+        os.replace(sidecar_file.name, sidecar_path)
+    except OSError:
+        pass
+    return data
+
+
+async def load_many(paths):
+    """
+    Load several YAML files concurrently with load_yaml_cached.
+
+    The files are read and parsed in worker threads, so a batch of files costs
+    roughly the slowest read instead of the sum of all reads.
+
+    :param paths: Paths to the YAML files.
+    :return: A list with the parsed content of each file, in the order of paths.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(load_yaml_cached, path) for path in paths)
+    )
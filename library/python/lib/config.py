@@ -1,7 +1,7 @@
+import functools
 import os
 
 import landscape_tools
-import yaml
 
 from . import common, gardener
 
@@ -22,21 +22,32 @@ class Config:
         )
 
     def write_kubeconfig_file(self):
-        with open(self.kubeconfig_file_path, "w") as kubeconfig_file:
-            kubeconfig_file.writelines(self.kubeconfig)
+        # The kubeconfig carries credentials, so it is only readable by the owner,
+        # also if the file already existed.
+        fd = os.open(
+            self.kubeconfig_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as kubeconfig_file:
+            kubeconfig_file.write(self.kubeconfig)
 
-    def get_gardener_helper(self):
-        return gardener.GardenerHelper(
+    async def get_gardener_helper(self):
+        return await gardener.GardenerHelper.create(
             self.kubeconfig_file_path,
             self.gardener_namespace,
             self.cluster_name,
         )
 
-    def get_dns_domain(self):
-        return yaml.safe_load(open(self.rendered_shoot_path, "r"))["spec"]["dns"][
+    @functools.cached_property
+    def dns_domain(self):
+        # The rendered shoot file is written once in __init__, so it is parsed once.
+        return common.load_yaml_cached(self.rendered_shoot_path)["spec"]["dns"][
             "domain"
         ]
 
+    def get_dns_domain(self):
+        return self.dns_domain
+
     def print_config(self):
         print(f"landscape_name: {self.landscape_name}")
         print(f"definition_dir: {self.definition_dir}")
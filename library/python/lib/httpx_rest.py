@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import ssl
+
+import httpx
+from kubernetes_asyncio.client import rest
+from kubernetes_asyncio.client.exceptions import ApiException
+
+try:
+    import orjson
+except ImportError:
+    # orjson.dumps returns bytes and json.dumps returns str; httpx accepts both.
+    import json as orjson
+
+# Time (in seconds) after which a request without an explicit timeout fails, as in
+# the aiohttp REST client of kubernetes_asyncio.
+DEFAULT_TIMEOUT = 5 * 60
+
+# httpx logs every request at INFO; only its warnings are of interest next to the
+# helper's own output.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Tasks closing released responses; the event loop only keeps weak references to
+# tasks, so they are kept here until they are done.
+_closing_responses = set()
+
+
+class HttpxResponse:
+    """
+    Preloaded httpx response with the interface of kubernetes_asyncio's RESTResponse.
+    """
+
+    def __init__(self, response, data):
+        self.httpx_response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = data
+
+    def getheaders(self):
+        return self.httpx_response.headers
+
+    def getheader(self, name, default=None):
+        return self.httpx_response.headers.get(name, default)
+
+
+class HttpxStreamReader:
+    """
+    Reader over the body of a streamed httpx response.
+
+    Implements the read/readline subset of aiohttp's StreamReader used by the
+    kubernetes_asyncio watch and by streaming parsers.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+        self._eof = False
+
+    async def _fill(self):
+        try:
+            self._buffer += await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._eof = True
+
+    def at_eof(self):
+        return self._eof and not self._buffer
+
+    async def read(self, n=-1):
+        """
+        Read up to n bytes, or the whole remaining body if n is negative.
+
+        :param n: Maximum number of bytes to read.
+        :return: The bytes read; empty at the end of the body.
+        """
+        if n < 0:
+            while not self._eof:
+                await self._fill()
+        elif not self._buffer and not self._eof:
+            await self._fill()
+        if n < 0:
+            n = len(self._buffer)
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
+
+    async def readline(self):
+        """
+        Read one line including its trailing newline.
+
+        :return: The line; empty at the end of the body.
+        """
+        while b"\n" not in self._buffer and not self._eof:
+            await self._fill()
+        end = self._buffer.find(b"\n") + 1 or len(self._buffer)
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+
+class HttpxStreamResponse:
+    """
+    Streamed httpx response with the subset of aiohttp's ClientResponse interface
+    that kubernetes_asyncio returns for requests without preloaded content.
+    """
+
+    def __init__(self, response):
+        self.httpx_response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.content = HttpxStreamReader(response.aiter_bytes())
+
+    async def read(self):
+        return await self.content.read()
+
+    def release(self):
+        task = asyncio.ensure_future(self.httpx_response.aclose())
+        _closing_responses.add(task)
+        task.add_done_callback(_closing_responses.discard)
+
+    def close(self):
+        self.release()
+
+
+class HttpxRESTClient(rest.RESTClientObject):
+    """
+    REST client for kubernetes_asyncio that sends all requests over HTTP/2 with httpx.
+
+    Concurrent requests are multiplexed over one TLS connection per host instead of
+    occupying one HTTP/1.1 connection each.
+    """
+
+    def __init__(self, configuration, max_connections):
+        """
+        Initialize the HttpxRESTClient object.
+
+        The aiohttp session of the base class is not created.
+
+        :param configuration: The kubernetes_asyncio client configuration.
+        :param max_connections: The maximum number of connections in the pool.
+        """
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        # The client certificate authenticates the client whether or not the
+        # server certificate is verified.
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if getattr(configuration, "disable_strict_ssl_verification", False):
+            ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
+        proxy = None
+        if configuration.proxy:
+            proxy = httpx.Proxy(configuration.proxy, headers=configuration.proxy_headers)
+        # A tls-server-name from the kubeconfig is sent as SNI and the server
+        # certificate is verified against it instead of the host of the URL.
+        tls_server_name = getattr(configuration, "tls_server_name", None)
+        self._extensions = {"sni_hostname": tls_server_name} if tls_server_name else {}
+        self.pool_manager = httpx.AsyncClient(
+            http2=True,
+            verify=ssl_context,
+            proxy=proxy,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def close(self):
+        await self.pool_manager.aclose()
+
+    async def request(
+        self,
+        method,
+        url,
+        query_params=None,
+        headers=None,
+        body=None,
+        post_params=None,
+        _preload_content=True,
+        _request_timeout=None,
+    ):
+        """
+        Send a request.
+
+        :param method: The HTTP method.
+        :param url: The request URL.
+        :param query_params: The query parameters as a list of tuples.
+        :param headers: The request headers.
+        :param body: The request body, serialized as JSON unless it is str or bytes.
+        :param post_params: Not supported; all API requests of this library send a body.
+        :param _preload_content: If False, return the streamed response without reading it.
+        :param _request_timeout: Total timeout in seconds, or a (connect, read) tuple.
+        :return: An HttpxResponse, or an HttpxStreamResponse if not preloaded.
+        :raises: ApiException if a preloaded response has a non-2xx status.
+        """
+        if post_params:
+            raise ValueError("Form parameters are not supported by HttpxRESTClient.")
+        headers = dict(headers or {})
+        content = None
+        if body is not None:
+            headers.setdefault("Content-Type", "application/json")
+            content = body if isinstance(body, (str, bytes)) else orjson.dumps(body)
+
+        if isinstance(_request_timeout, (int, float)):
+            timeout = httpx.Timeout(_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = httpx.Timeout(None, connect=_request_timeout[0], read=_request_timeout[1])
+        elif any(name == "watch" and value for name, value in query_params or ()):
+            # Watches stay open for as long as the server sends events.
+            timeout = httpx.Timeout(DEFAULT_TIMEOUT, read=None)
+        else:
+            timeout = httpx.Timeout(DEFAULT_TIMEOUT)
+
+        request = self.pool_manager.build_request(
+            method,
+            url,
+            params=query_params,
+            headers=headers,
+            content=content,
+            timeout=timeout,
+            extensions=self._extensions,
+        )
+        response = await self.pool_manager.send(request, stream=True)
+        if not _preload_content:
+            return HttpxStreamResponse(response)
+
+        try:
+            data = await response.aread()
+        finally:
+            await response.aclose()
+        r = HttpxResponse(response, data)
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+        return r